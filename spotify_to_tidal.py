@@ -12,14 +12,19 @@ Supported CSV format (exported by tools like Exportify):
   ISRC, Added By, Added At
 
 Requirements:
+  Python 3.10+
   pip install tidalapi requests pygame rich
 
 Usage:
   python spotify_to_tidal.py <path_to_csv>
   python spotify_to_tidal.py <path_to_csv> --name "My Playlist"
   python spotify_to_tidal.py <path_to_csv> --session-file tidal_session.json
+  python spotify_to_tidal.py <path_to_csv> --concurrency 4
+  python spotify_to_tidal.py <path_to_csv> --mode review
   python spotify_to_tidal.py --folder <path_to_folder>
   python spotify_to_tidal.py --folder <path_to_folder> --session-file tidal_session.json
+  python spotify_to_tidal.py --folder <path_to_folder> --assume-yes
+  python spotify_to_tidal.py --folder <path_to_folder> --folder-concurrency 3
 ────────────────────────────────────────────────────────────────────
 """
 
@@ -27,16 +32,30 @@ from __future__ import annotations
 
 import argparse
 import csv
+import functools
+import importlib.util
 import io
+import itertools
+import mmap
 import os
+import queue
+import re
+import shutil
+import sqlite3
+import stat
+import subprocess
 import sys
-import tempfile
+import threading
 import time
+import unicodedata
+import urllib.parse
 import warnings
 import webbrowser
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
 # ── third-party ──────────────────────────────────────────────────
 try:
@@ -44,32 +63,37 @@ try:
 except ImportError:
     sys.exit("❌  tidalapi not found. Run: pip install tidalapi")
 
+# tidalapi 0.8+ turns a 429 and a 404 into its own exceptions instead of an
+# HTTPError; older releases don't have them
 try:
-    import requests
+    import tidalapi.exceptions as _tidal_exceptions
 except ImportError:
-    sys.exit("❌  requests not found. Run: pip install requests")
+    _tidal_exceptions = None
+_TidalTooManyRequests = getattr(_tidal_exceptions, "TooManyRequests", None)
+_TidalObjectNotFound = getattr(_tidal_exceptions, "ObjectNotFound", None)
 
 try:
-    import pygame
-    _PYGAME_AVAILABLE = True
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
 except ImportError:
-    _PYGAME_AVAILABLE = False
+    sys.exit("❌  requests not found. Run: pip install requests")
 
-# term-image warning must be filtered before the module loads
-warnings.filterwarnings("ignore", category=UserWarning, message=".*not running within a terminal.*")
-try:
-    from term_image.image import AutoImage, from_url  # type: ignore
-    _TERM_IMAGE_AVAILABLE = True
-except ImportError:
-    _TERM_IMAGE_AVAILABLE = False
+# pygame, term-image and Pillow are only needed for interactive review, so
+# they are imported where used; loading SDL or the image stack at startup
+# would slow down every run.
+_PYGAME_AVAILABLE = importlib.util.find_spec("pygame") is not None
+_TERM_IMAGE_AVAILABLE = importlib.util.find_spec("term_image") is not None
 
+# pyarrow and pandas are optional; when installed, their native parsers read
+# very large exports
+_PYARROW_AVAILABLE = importlib.util.find_spec("pyarrow") is not None
+_PANDAS_AVAILABLE = importlib.util.find_spec("pandas") is not None
+
+# Only Console is needed up front; other rich components are imported
+# where they are used.
 try:
     from rich.console import Console
-    from rich.table import Table
-    from rich.panel import Panel
-    from rich.progress import Progress, SpinnerColumn, TextColumn
-    from rich.prompt import Prompt, Confirm
-    from rich import print as rprint
     _RICH_AVAILABLE = True
 except ImportError:
     _RICH_AVAILABLE = False
@@ -78,31 +102,80 @@ except ImportError:
 # ─────────────────────────────────────────────────────────────────
 # Minimal fallback console when rich is not installed
 # ─────────────────────────────────────────────────────────────────
+# Rich markup tags such as [bold cyan] or [/dim]
+_MARKUP_RE = re.compile(r"\[[^\]]*\]")
+
+
 class _FallbackConsole:
+    __slots__ = ()
+
     def print(self, *args, **kwargs):
         # strip rich markup for plain output
-        import re
         text = " ".join(str(a) for a in args)
-        text = re.sub(r"\[.*?\]", "", text)
+        text = _MARKUP_RE.sub("", text)
         print(text)
 
     def rule(self, title=""):
-        print(f"\n{'─' * 60}  {title}")
+        print(f"\n{'─' * 60}  {_MARKUP_RE.sub('', title)}")
 
     def log(self, *args, **kwargs):
         self.print(*args)
 
 
+class _FallbackPanel:
+    """Stand-in for rich.panel.Panel.fit: a panel is just its content."""
+    __slots__ = ()
+
+    @staticmethod
+    def fit(renderable, **kwargs):
+        return renderable
+
+
 if _RICH_AVAILABLE:
     console = Console()
 else:
     console = _FallbackConsole()
 
 
+def _panel_class():
+    """Return rich's Panel (imported on first use), or the plain stand-in."""
+    if not _RICH_AVAILABLE:
+        return _FallbackPanel
+    from rich.panel import Panel
+
+    return Panel
+
+
+def _make_say(style: str):
+    """Build a printer that shows a whole line in rich *style*.
+
+    Whether rich is available is decided here once, not at every call site;
+    the fallback console prints the text unstyled.
+    """
+    if not _RICH_AVAILABLE:
+        return console.print
+
+    def say(msg: str) -> None:
+        console.print(f"[{style}]{msg}[/{style}]")
+
+    return say
+
+
+_say_bold = _make_say("bold")
+_say_cyan = _make_say("cyan")
+_say_green = _make_say("green")
+_say_red = _make_say("red")
+_say_yellow = _make_say("yellow")
+_say_bold_cyan = _make_say("bold cyan")
+_say_bold_green = _make_say("bold green")
+_say_bold_red = _make_say("bold red")
+_say_bold_yellow = _make_say("bold yellow")
+
+
 # ─────────────────────────────────────────────────────────────────
 # Data classes
 # ─────────────────────────────────────────────────────────────────
-@dataclass
+@dataclass(slots=True)
 class SpotifyTrack:
     name: str
     artists: str
@@ -112,67 +185,288 @@ class SpotifyTrack:
     image_url: str
     duration_ms: int
     explicit: bool
+    display: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.display = f"{self.name} — {self.artists}"
+
+
+# ImportResult.status values
+_PENDING = "pending"
+_ADDED = "added"
+_SKIPPED = "skipped"
+_NOT_FOUND = "not_found"
 
-    def display_name(self) -> str:
-        return f"{self.name} — {self.artists}"
 
+@dataclass(slots=True)
+class TidalTrackRef:
+    """A TIDAL track known only by id, e.g. from the ISRC cache.
 
-@dataclass
+    Enough for playlist.add(); summaries fall back to the Spotify metadata.
+    """
+    id: int
+
+
+@dataclass(slots=True)
 class ImportResult:
     spotify_track: SpotifyTrack
-    tidal_track: Optional[object] = None  # tidalapi.Track
-    status: str = "pending"  # pending | added | skipped | not_found
+    tidal_track: Optional[object] = None  # tidalapi.Track or TidalTrackRef
+    status: str = _PENDING  # _PENDING | _ADDED | _SKIPPED | _NOT_FOUND
+
+
+class ImportInterrupted(KeyboardInterrupt):
+    """Ctrl+C during an import; *playlist* holds the tracks saved so far, or None."""
+
+    def __init__(self, playlist: Optional[object]):
+        super().__init__()
+        self.playlist = playlist
 
 
 # ─────────────────────────────────────────────────────────────────
 # CSV helpers
 # ─────────────────────────────────────────────────────────────────
-def load_csv(path: Path) -> list[SpotifyTrack]:
-    """Parse the Spotify export CSV and return a list of SpotifyTrack objects."""
+# Delimiters recognised when sniffing an export's header line
+CSV_DELIMITERS = "\t,;|"
+
+# Exports larger than this are memory-mapped instead of read through buffers
+MMAP_THRESHOLD = 1 << 20
+
+# Exports larger than this are handed to pyarrow or pandas when installed;
+# below it, importing either costs more than its native parser saves
+COLUMNAR_THRESHOLD = 16 << 20
+
+# Columns read from an export; everything else is ignored
+CSV_COLUMNS = (
+    "Track Name", "Artist Name(s)", "Album Name", "ISRC", "Track Preview URL",
+    "Album Image URL", "Explicit", "Track Duration (ms)",
+)
+
+
+def load_csv(path: Path, size: Optional[int] = None) -> list[SpotifyTrack]:
+    """Parse the Spotify export CSV and return a list of SpotifyTrack objects.
+
+    *size* is the file size in bytes, if the caller has already stat()ed it.
+    """
+    if size is None:
+        size = path.stat().st_size
+    if size > COLUMNAR_THRESHOLD:
+        tracks = None
+        if _PYARROW_AVAILABLE:
+            tracks = _load_csv_pyarrow(path)
+        if tracks is None and _PANDAS_AVAILABLE:
+            tracks = _load_csv_pandas(path)
+        if tracks is not None:
+            return tracks
+
+    if size > MMAP_THRESHOLD:
+        # Large library exports: let the OS page the file in on demand
+        with path.open("rb") as raw, mmap.mmap(raw.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return _parse_csv(_mmap_lines(mm))
+
+    # Files at or below the threshold fit in one buffer, i.e. a single read()
+    with path.open(newline="", encoding="utf-8-sig", buffering=MMAP_THRESHOLD) as fh:
+        return _parse_csv(fh)
+
+
+def _mmap_lines(mm: mmap.mmap) -> Iterator[str]:
+    """Yield decoded lines from a memory-mapped UTF-8 file, dropping a leading BOM."""
+    lines = iter(mm.readline, b"")
+    first = next(lines, b"")
+    if first:
+        yield first.decode("utf-8-sig")
+    for line in lines:
+        yield line.decode("utf-8")
+
+
+def _sniff_delimiter(header_line: str) -> str:
+    """Guess an export's delimiter from its header line, defaulting to a comma.
+
+    Supports tab-, comma-, semicolon- and pipe-delimited exports (the latter
+    two come from spreadsheet re-saves in some locales). Only the delimiter
+    is taken from the sniffer: a header line alone can't tell it how quotes
+    are escaped, and Exportify relies on the default doubled quotes.
+    """
+    try:
+        return csv.Sniffer().sniff(header_line, delimiters=CSV_DELIMITERS).delimiter
+    except csv.Error:
+        return ","
+
+
+def _parse_duration(value: str) -> int:
+    try:
+        return int(value)
+    except ValueError:
+        return 0
+
+
+def _parse_explicit(value: str) -> bool:
+    return value.lower() in ("true", "yes", "1")
+
+
+def _parse_csv(lines: Iterator[str]) -> list[SpotifyTrack]:
+    """Build SpotifyTracks from the lines of an export, header first."""
     tracks: list[SpotifyTrack] = []
+    lines = iter(lines)
+
+    header_line = next(lines, "")
+    delimiter = _sniff_delimiter(header_line)
+    reader = csv.reader(itertools.chain([header_line], lines), delimiter=delimiter)
+    header = next(reader, None)
+    if not header:
+        return tracks
+
+    # Resolve column positions once; header names are whitespace-normalised
+    columns = {name.strip(): idx for idx, name in enumerate(header)}
+    i_name = columns.get("Track Name")
+    i_artists = columns.get("Artist Name(s)")
+    i_album = columns.get("Album Name")
+    i_isrc = columns.get("ISRC")
+    i_preview = columns.get("Track Preview URL")
+    i_image = columns.get("Album Image URL")
+    i_explicit = columns.get("Explicit")
+    i_duration = columns.get("Track Duration (ms)")
+
+    def cell(row: list[str], idx: Optional[int], default: str = "") -> str:
+        # Missing column → default; short row → empty string
+        if idx is None:
+            return default
+        return row[idx].strip() if idx < len(row) else ""
+
+    for row in reader:
+        if not row:
+            continue
+
+        tracks.append(SpotifyTrack(
+            name=cell(row, i_name, "Unknown"),
+            artists=cell(row, i_artists, "Unknown"),
+            album=cell(row, i_album, "Unknown"),
+            isrc=cell(row, i_isrc),
+            preview_url=cell(row, i_preview),
+            image_url=cell(row, i_image),
+            duration_ms=_parse_duration(cell(row, i_duration, "0")),
+            explicit=_parse_explicit(cell(row, i_explicit, "False")),
+        ))
+
+    return tracks
+
+
+def _tracks_from_columns(column) -> list[SpotifyTrack]:
+    """Build SpotifyTracks from a columnar parse.
+
+    ``column(name, default)`` returns the stripped cells of a column, or
+    *default* for every row when the export lacks it.
+    """
+    return [
+        SpotifyTrack(
+            name=name,
+            artists=artists,
+            album=album,
+            isrc=isrc,
+            preview_url=preview_url,
+            image_url=image_url,
+            duration_ms=_parse_duration(duration),
+            explicit=_parse_explicit(explicit),
+        )
+        for name, artists, album, isrc, preview_url, image_url, duration, explicit in zip(
+            column("Track Name", "Unknown"),
+            column("Artist Name(s)", "Unknown"),
+            column("Album Name", "Unknown"),
+            column("ISRC", ""),
+            column("Track Preview URL", ""),
+            column("Album Image URL", ""),
+            column("Track Duration (ms)", "0"),
+            column("Explicit", "False"),
+        )
+    ]
+
+
+def _load_csv_pyarrow(path: Path) -> Optional[list[SpotifyTrack]]:
+    """Parse an export with pyarrow's multithreaded C++ reader.
+
+    Returns None when pyarrow rejects the file (e.g. rows with a different
+    field count, which the csv module tolerates), so the caller can fall back.
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    from pyarrow import csv as pa_csv
 
     with path.open(newline="", encoding="utf-8-sig") as fh:
-        reader = csv.DictReader(fh, delimiter="\t")
+        header_line = fh.readline()
+    delimiter = _sniff_delimiter(header_line)
+    # The header is passed in already parsed, so its BOM and padding are gone
+    names = [name.strip() for name in next(csv.reader([header_line], delimiter=delimiter), [])]
+    present = [name for name in CSV_COLUMNS if name in names]
+
+    try:
+        table = pa_csv.read_csv(
+            path,
+            read_options=pa_csv.ReadOptions(column_names=names, skip_rows=1),
+            parse_options=pa_csv.ParseOptions(delimiter=delimiter, newlines_in_values=True),
+            convert_options=pa_csv.ConvertOptions(
+                include_columns=present,
+                column_types={name: pa.string() for name in present},
+            ),
+        )
+    except (pa.ArrowException, ValueError):
+        return None
 
-        # Support both tab- and comma-delimited exports
-        if reader.fieldnames and len(reader.fieldnames) == 1:
-            fh.seek(0)
-            reader = csv.DictReader(fh, delimiter=",")
+    rows = table.num_rows
 
-        for row in reader:
-            # Normalise header names (strip whitespace)
-            row = {k.strip(): v.strip() if v else "" for k, v in row.items()}
+    def column(name: str, default: str) -> list[str]:
+        if name not in present:
+            return [default] * rows
+        return pc.utf8_trim_whitespace(table.column(name)).to_pylist()
 
-            isrc = row.get("ISRC", "").strip()
-            name = row.get("Track Name", "Unknown")
-            artists = row.get("Artist Name(s)", "Unknown")
-            album = row.get("Album Name", "Unknown")
-            preview_url = row.get("Track Preview URL", "")
-            image_url = row.get("Album Image URL", "")
-            explicit = row.get("Explicit", "False").lower() in ("true", "yes", "1")
+    return _tracks_from_columns(column)
 
-            try:
-                duration_ms = int(row.get("Track Duration (ms)", 0))
-            except ValueError:
-                duration_ms = 0
-
-            tracks.append(SpotifyTrack(
-                name=name,
-                artists=artists,
-                album=album,
-                isrc=isrc,
-                preview_url=preview_url,
-                image_url=image_url,
-                duration_ms=duration_ms,
-                explicit=explicit,
-            ))
 
-    return tracks
+def _load_csv_pandas(path: Path) -> Optional[list[SpotifyTrack]]:
+    """Parse an export with pandas' C parser.
+
+    Returns None when pandas rejects the file (e.g. rows with extra fields,
+    which the csv module tolerates), so the caller can fall back.
+    """
+    import pandas as pd
+
+    with path.open(newline="", encoding="utf-8-sig") as fh:
+        delimiter = _sniff_delimiter(fh.readline())
+
+    try:
+        df = pd.read_csv(
+            path,
+            sep=delimiter,
+            engine="c",
+            index_col=False,
+            encoding="utf-8-sig",
+            dtype=str,
+            keep_default_na=False,
+            usecols=lambda name: name.strip() in CSV_COLUMNS,
+        )
+    except (ValueError, pd.errors.ParserError):
+        return None
+
+    # Short rows leave NaN in their missing cells
+    df = df.rename(columns=str.strip).fillna("")
+    rows = len(df)
+
+    def column(name: str, default: str) -> list[str]:
+        if name not in df:
+            return [default] * rows
+        return df[name].str.strip().tolist()
+
+    return _tracks_from_columns(column)
 
 
 def discover_csv_files(folder: Path) -> list[Path]:
     """Return all CSV files found directly within the given folder (non-recursive)."""
-    csv_files = sorted(folder.glob("*.csv"))
+    # scandir usually gets each entry's type from the directory listing
+    # itself, so telling files from directories rarely needs a stat call
+    with os.scandir(folder) as entries:
+        csv_files = sorted(
+            Path(entry.path)
+            for entry in entries
+            if entry.name.lower().endswith(".csv") and entry.is_file()
+        )
     return csv_files
 
 
@@ -182,10 +476,10 @@ def discover_csv_files(folder: Path) -> list[Path]:
 def get_tidal_session(session_file: Optional[str] = None) -> tidalapi.Session:
     """Authenticate with TIDAL, reusing a stored session when available.
 
-    login_session_file() handles both cases transparently:
-    - If the session file exists and is valid, it restores the session.
-    - If the file doesn't exist or the session has expired, it performs a
-      fresh OAuth login and writes the new session to the file.
+    - If the session file exists and is valid, the session is restored
+      (tidalapi refreshes an expired access token on its own).
+    - Otherwise a fresh OAuth login runs.
+    The resulting session is written back to the file for next time.
     """
     session = tidalapi.Session()
     session_path = Path(session_file) if session_file else Path("tidal_session.json")
@@ -199,57 +493,520 @@ def get_tidal_session(session_file: Optional[str] = None) -> tidalapi.Session:
 
     def _print(msg: str) -> None:
         console.print(f"[cyan]{msg}[/cyan]")
+        # The login link must show up before we block waiting on it
+        sys.stdout.flush()
 
-    success = session.login_session_file(session_path, fn_print=_print)
+    logged_in = session_path.exists() and _restore_session(session, session_path)
+    if not logged_in:
+        session.login_oauth_simple(fn_print=_print)
+        logged_in = session.check_login()
 
-    if success and session.check_login():
-        console.print("[green]✅  Logged in successfully.[/green]")
-    else:
+    if not logged_in:
         sys.exit("❌  TIDAL login failed. Please try again.")
 
+    console.print("[green]✅  Logged in successfully.[/green]")
+    try:
+        _save_session(session, session_path)
+    except Exception as exc:
+        _say_yellow(f"⚠️  Could not save session to {session_path}: {exc}")
+
     return session
 
 
+def _restore_session(session: tidalapi.Session, path: Path) -> bool:
+    """Load a saved session, returning whether it is still logged in."""
+    try:
+        session.load_session_from_file(path)
+        return session.check_login()
+    except Exception:
+        return False  # unreadable, foreign or revoked; log in from scratch
+
+
+def _save_session(session: tidalapi.Session, path: Path) -> None:
+    """Write the session to *path*, readable by the owner only.
+
+    tidalapi writes the file into a sibling created with mode 0600, which is
+    then moved into place, so an interrupted write never leaves a truncated
+    session behind.
+    """
+    tmp_path = path.with_name(path.name + ".tmp")
+    # A leftover from an interrupted run could carry looser permissions
+    tmp_path.unlink(missing_ok=True)
+    os.close(os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600))
+    try:
+        session.save_session_to_file(tmp_path)
+        # tidalapi re-checks the login and silently writes nothing if that
+        # fails; never let an empty file replace a good one
+        if tmp_path.stat().st_size == 0:
+            raise OSError("tidalapi wrote no session data")
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
 # ─────────────────────────────────────────────────────────────────
 # TIDAL search helpers
 # ─────────────────────────────────────────────────────────────────
+# Number of TIDAL lookups allowed in flight at once during import_all.
+# Capped to stay clear of TIDAL's CloudFront rate limiting.
+DEFAULT_CONCURRENCY = 8
+MAX_CONCURRENCY = 8
+
+
+ISRC_CACHE_PATH = Path.home() / ".cache" / "spotify_to_tidal" / "isrc.db"
+
+
+# A cached "not found on TIDAL" is trusted for this long; the catalogue grows,
+# so misses are searched again after a while. Matches never expire.
+SEARCH_MISS_TTL = 7 * 24 * 3600
+
+
+class _IsrcCache:
+    """Persistent map of ISRCs and text searches to TIDAL track ids, backed by SQLite.
+
+    Lookups read the database directly; new entries are buffered in memory and
+    written in a single transaction by flush(), so an import costs one fsync.
+    Safe to share between the search worker threads.
+    """
+
+    def __init__(self, path: Path = ISRC_CACHE_PATH):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._pending: dict[str, int] = {}
+        self._pending_searches: dict[str, tuple[Optional[int], float]] = {}
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS isrc_cache (isrc TEXT PRIMARY KEY, tidal_id INTEGER NOT NULL)"
+        )
+        # tidal_id is NULL for a search that found nothing
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS search_cache "
+            "(key TEXT PRIMARY KEY, tidal_id INTEGER, searched_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    def get(self, isrc: str) -> Optional[int]:
+        with self._lock:
+            if isrc in self._pending:
+                return self._pending[isrc]
+            row = self._conn.execute(
+                "SELECT tidal_id FROM isrc_cache WHERE isrc = ?", (isrc,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def put(self, isrc: str, tidal_id: int) -> None:
+        with self._lock:
+            self._pending[isrc] = tidal_id
+
+    def get_search(self, key: str) -> tuple[bool, Optional[int]]:
+        """Look up a text search by its _search_key.
+
+        Returns (True, id) for a cached match, (True, None) for a recent
+        cached miss and (False, None) when the search has to be run.
+        """
+        with self._lock:
+            row = self._pending_searches.get(key)
+            if row is None:
+                row = self._conn.execute(
+                    "SELECT tidal_id, searched_at FROM search_cache WHERE key = ?", (key,)
+                ).fetchone()
+        if row is None:
+            return False, None
+        tidal_id, searched_at = row
+        if tidal_id is None and time.time() - searched_at > SEARCH_MISS_TTL:
+            return False, None
+        return True, tidal_id
+
+    def put_search(self, key: str, tidal_id: Optional[int]) -> None:
+        with self._lock:
+            self._pending_searches[key] = (tidal_id, time.time())
+
+    def flush(self) -> None:
+        """Write all buffered entries to disk in one transaction."""
+        with self._lock:
+            if not self._pending and not self._pending_searches:
+                return
+            with self._conn:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO isrc_cache (isrc, tidal_id) VALUES (?, ?)",
+                    self._pending.items(),
+                )
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO search_cache (key, tidal_id, searched_at) VALUES (?, ?, ?)",
+                    ((key, tidal_id, at) for key, (tidal_id, at) in self._pending_searches.items()),
+                )
+            self._pending.clear()
+            self._pending_searches.clear()
+
+
+@functools.lru_cache(maxsize=None)
+def _get_isrc_cache() -> Optional[_IsrcCache]:
+    """Open the shared match cache, or return None if it can't be created."""
+    try:
+        return _IsrcCache()
+    except (OSError, sqlite3.Error) as exc:
+        console.print(f"[dim]Match cache disabled: {exc}[/dim]")
+        return None
+
+
+# Default ceiling on TIDAL API calls per second, shared by all search threads
+DEFAULT_RATE = 5.0
+
+
+class _RateLimiter:
+    """Token bucket shared by every TIDAL lookup.
+
+    Allows bursts of up to *capacity* calls, then *rate* calls per second.
+    acquire() only sleeps once the bucket is empty, so a run that stays under
+    the limit never waits.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[int] = None):
+        self._lock = threading.Lock()
+        self.configure(rate, capacity)
+
+    def configure(self, rate: float, capacity: Optional[int] = None) -> None:
+        with self._lock:
+            self.rate = rate
+            self.capacity = capacity or max(1, int(rate))
+            self._tokens = float(self.capacity)
+            self._updated = time.monotonic()
+
+    def acquire(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # Reserve a token; a negative balance is the wait owed by this caller
+            self._tokens -= 1
+            delay = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if delay:
+            time.sleep(delay)
+
+
+_tidal_limiter = _RateLimiter(DEFAULT_RATE)
+
+
+# TIDAL's v2 API accepts up to this many ISRCs per filter[isrc] query
+ISRC_BATCH_SIZE = 20
+
+
+def _retry_with_backoff(fn, attempts: int = 5, base: float = 0.5):
+    """Call *fn*, retrying with exponential backoff while TIDAL answers 429.
+
+    Both a raw requests.HTTPError and tidalapi's TooManyRequests count as a
+    429. A Retry-After value, when present (the header, or the exception's
+    retry_after), sets the minimum wait. Any other error (or a 429 on the
+    last attempt) is raised to the caller.
+    """
+    for attempt in range(attempts):
+        try:
+            return fn()
+        except Exception as exc:
+            if attempt == attempts - 1:
+                raise
+            delay = base * (2 ** attempt)
+            if _TidalTooManyRequests is not None and isinstance(exc, _TidalTooManyRequests):
+                # tidalapi copies the header into retry_after, -1 when absent
+                retry_after = getattr(exc, "retry_after", -1) or -1
+                if retry_after > 0:
+                    delay = max(delay, float(retry_after))
+            elif isinstance(exc, requests.HTTPError) and getattr(exc.response, "status_code", None) == 429:
+                retry_after = exc.response.headers.get("Retry-After", "")
+                if retry_after.isdigit():
+                    delay = max(delay, float(retry_after))
+            else:
+                raise
+            time.sleep(delay)
+
+
+def _batch_isrc_lookup(
+    session: tidalapi.Session,
+    isrcs: list[str],
+    batch_size: int = ISRC_BATCH_SIZE,
+) -> dict[str, Optional[int]]:
+    """Resolve many ISRCs to TIDAL track ids with one request per batch.
+
+    Maps each answered ISRC to its track id, or to None when TIDAL has no
+    match. One ISRC can map to several releases, so a batch's answer may
+    span several pages; they are followed through links.next. ISRCs are
+    only recorded as misses once every page has been read; otherwise, like
+    those from a failed batch, they are left out so the caller can still
+    look them up one by one.
+    """
+    base_url = getattr(session.config, "openapi_v2_location", None)
+    if not base_url:
+        return {}  # older tidalapi without the v2 API
+
+    resolved: dict[str, Optional[int]] = {}
+    for batch in _chunks(isrcs, batch_size):
+        found: dict[str, int] = {}
+        params: dict[str, object] = {"filter[isrc]": batch}
+        complete = False
+        while True:
+            _tidal_limiter.acquire()
+            try:
+                payload = _retry_with_backoff(lambda: session.request.request(
+                    "GET",
+                    "tracks",
+                    params=params,
+                    base_url=base_url,
+                ).json())
+            except Exception:
+                break
+
+            for item in payload.get("data", []):
+                isrc = item.get("attributes", {}).get("isrc")
+                if isrc in batch:
+                    found.setdefault(isrc, int(item["id"]))
+
+            next_link = (payload.get("links") or {}).get("next")
+            if not next_link:
+                complete = True
+                break
+            cursor = _page_cursor(next_link)
+            if cursor is None or cursor == params.get("page[cursor]"):
+                break
+            params = {"filter[isrc]": batch, "page[cursor]": cursor}
+
+        if complete:
+            resolved.update(dict.fromkeys(batch))
+        resolved.update(found)
+
+    return resolved
+
+
+def _page_cursor(link: str) -> Optional[str]:
+    """Extract the page[cursor] value from a JSON:API links.next URL."""
+    values = urllib.parse.parse_qs(urllib.parse.urlsplit(link).query).get("page[cursor]")
+    return values[0] if values else None
+
+
+def resolve_isrcs(
+    session: tidalapi.Session,
+    tracks: list[SpotifyTrack],
+    cache: Optional[_IsrcCache] = None,
+) -> dict[str, Optional[int]]:
+    """Batch-resolve the distinct ISRCs in *tracks* that aren't cached yet.
+
+    The result is meant to be passed to find_tidal_track as *isrc_ids*.
+    """
+    unresolved = sorted({
+        t.isrc for t in tracks
+        if t.isrc and (cache is None or cache.get(t.isrc) is None)
+    })
+    return _batch_isrc_lookup(session, unresolved)
+
+
 def find_tidal_track(
     session: tidalapi.Session,
     track: SpotifyTrack,
-    retry_delay: float = 0.3,
+    cache: Optional[_IsrcCache] = None,
+    isrc_ids: Optional[dict[str, Optional[int]]] = None,
+    hydrate: bool = True,
 ) -> Optional[object]:
     """
     Look up a track on TIDAL, preferring ISRC match.
     Falls back to title + artist text search.
+
+    When a *cache* is given, ISRCs resolved on a previous run are fetched
+    directly by TIDAL id, and searches already run for the same artist,
+    title and album reuse their answer, including a recent "not found".
+    New results are recorded for next time. *isrc_ids* holds the answers
+    of a prior _batch_isrc_lookup; ISRCs it covers skip the per-track ISRC
+    query. With ``hydrate=False`` an id known from any of these sources is
+    returned as a TidalTrackRef without fetching the full track.
     """
-    # 1. ISRC lookup (exact match)
+    # 0. Previously resolved ISRC (on disk or from the batch pre-pass)
     if track.isrc:
+        cached_id = cache.get(track.isrc) if cache is not None else None
+        tidal_id = cached_id if cached_id is not None else (isrc_ids or {}).get(track.isrc)
+        if tidal_id is not None:
+            tidal_track = _track_by_id(session, tidal_id, hydrate)
+            if tidal_track is not None:
+                if cache is not None and cached_id is None:
+                    cache.put(track.isrc, tidal_id)
+                return tidal_track
+            # stale id — fall through to a fresh lookup
+
+    # 1. Previously searched artist/title/album
+    search_key = _search_key(track)
+    if cache is not None:
+        hit, tidal_id = cache.get_search(search_key)
+        if hit and tidal_id is None:
+            return None
+        if hit:
+            tidal_track = _track_by_id(session, tidal_id, hydrate)
+            if tidal_track is not None:
+                return tidal_track
+
+    skip_isrc = isrc_ids is not None and track.isrc in isrc_ids
+    tidal_track, conclusive = _search_tidal_track(session, track, skip_isrc=skip_isrc)
+
+    if cache is not None:
+        if tidal_track is not None and track.isrc:
+            cache.put(track.isrc, tidal_track.id)
+        # A miss is only remembered if no request failed along the way
+        if tidal_track is not None or conclusive:
+            cache.put_search(search_key, tidal_track.id if tidal_track is not None else None)
+
+    return tidal_track
+
+
+def _track_by_id(session: tidalapi.Session, tidal_id: int, hydrate: bool) -> Optional[object]:
+    """Return the track for a known TIDAL id, or None if it can no longer be fetched."""
+    if not hydrate:
+        return TidalTrackRef(tidal_id)
+    _tidal_limiter.acquire()
+    try:
+        return session.track(tidal_id)
+    except Exception:
+        return None
+
+
+# Runs of punctuation, symbols and whitespace
+_NON_WORD_RE = re.compile(r"[\W_]+")
+
+
+def _normalize(text: str) -> str:
+    """Casefold *text* and drop accents and punctuation, for cache keys."""
+    decomposed = unicodedata.normalize("NFKD", text)
+    bare = "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+    return _NON_WORD_RE.sub(" ", bare.casefold()).strip()
+
+
+def _search_key(track: SpotifyTrack) -> str:
+    """Key for the search cache: normalised artist, title and album."""
+    return "\x1f".join(_normalize(part) for part in (track.artists, track.name, track.album))
+
+
+def _first_artist(track: SpotifyTrack) -> str:
+    return track.artists.split(",")[0]
+
+
+def _lookup_key(track: SpotifyTrack) -> object:
+    """Key under which two tracks are certain to get the same TIDAL match.
+
+    The ISRC when there is one; otherwise exactly what the text search sends.
+    """
+    return track.isrc or (track.name, _first_artist(track))
+
+
+def _search_tidal_track(
+    session: tidalapi.Session,
+    track: SpotifyTrack,
+    skip_isrc: bool = False,
+) -> tuple[Optional[object], bool]:
+    """Query TIDAL by ISRC, then by title + artist.
+
+    Returns the match (or None) and whether every request succeeded; a miss
+    after a failed request may not be a real one.
+    """
+    conclusive = True
+
+    # 1. ISRC lookup (exact match)
+    if track.isrc and not skip_isrc:
+        _tidal_limiter.acquire()
         try:
             results = session.get_tracks_by_isrc(track.isrc)
             if results:
-                return results[0]
-        except Exception:
-            pass
-
-    # Throttle to avoid rate-limiting
-    time.sleep(retry_delay)
+                return results[0], True
+        except Exception as exc:
+            # tidalapi 0.8 reports an unknown ISRC as ObjectNotFound, which
+            # is a real answer rather than a failed request
+            if _TidalObjectNotFound is None or not isinstance(exc, _TidalObjectNotFound):
+                conclusive = False
 
     # 2. Text search fallback
-    query = f"{track.name} {track.artists.split(',')[0]}"
+    query = f"{track.name} {_first_artist(track)}"
+    _tidal_limiter.acquire()
     try:
         results = session.search(query, models=[tidalapi.Track], limit=5)
         hits: list = results.get("tracks", [])
         if hits:
-            return hits[0]
+            return hits[0], True
     except Exception:
-        pass
+        conclusive = False
 
-    return None
+    return None, conclusive
 
 
 # ─────────────────────────────────────────────────────────────────
 # Media / UI helpers
 # ─────────────────────────────────────────────────────────────────
+# Shared HTTP session for media downloads: keep-alive and TLS session reuse
+# avoid a fresh handshake for every cover image and preview.
+_http = requests.Session()
+_http_adapter = HTTPAdapter(
+    pool_connections=8,
+    pool_maxsize=16,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 502, 503, 504]),
+)
+# Media URLs come straight from the CSV; pool and retry both schemes alike
+for _scheme in ("https://", "http://"):
+    _http.mount(_scheme, _http_adapter)
+
+_PREFETCH_MAX = 16
+_prefetch_pool = ThreadPoolExecutor(max_workers=4)
+_prefetch_futures: OrderedDict[str, Future] = OrderedDict()
+_prefetch_lock = threading.Lock()
+
+
+def _download(url: str) -> bytes:
+    response = _http.get(url, timeout=10)
+    response.raise_for_status()
+    return response.content
+
+
+def _load_image(url: str):
+    """Download and fully decode a cover image into a PIL image."""
+    from PIL import Image  # term-image depends on Pillow
+
+    image = Image.open(io.BytesIO(_download(url)))
+    image.load()  # decode now rather than on first draw
+    return image
+
+
+def _prefetch(url: str, loader=_download) -> None:
+    """Start ``loader(url)`` in the background so a later _take_prefetched is instant.
+
+    Keeps at most _PREFETCH_MAX results around, evicting the oldest first.
+    """
+    if not url:
+        return
+    with _prefetch_lock:
+        if url in _prefetch_futures:
+            _prefetch_futures.move_to_end(url)
+            return
+        _prefetch_futures[url] = _prefetch_pool.submit(loader, url)
+        while len(_prefetch_futures) > _PREFETCH_MAX:
+            _, stale = _prefetch_futures.popitem(last=False)
+            stale.cancel()
+
+
+def _take_prefetched(url: str):
+    """Claim the prefetched result for *url*, or None if it wasn't (successfully) prefetched."""
+    with _prefetch_lock:
+        future = _prefetch_futures.pop(url, None)
+    if future is None or future.cancelled():
+        return None
+    try:
+        return future.result()
+    except Exception:
+        return None
+
+
+def _download_to(url: str, fh, chunk_size: int = 64 * 1024) -> None:
+    """Stream the body of *url* into the binary file-like *fh* chunk by chunk."""
+    with _http.get(url, timeout=10, stream=True) as response:
+        response.raise_for_status()
+        for chunk in response.iter_content(chunk_size):
+            fh.write(chunk)
+
+
 def display_cover_art(image_url: str) -> None:
     """Download and render album cover art inline in the terminal (requires term-image).
 
@@ -263,8 +1020,14 @@ def display_cover_art(image_url: str) -> None:
         return
 
     try:
-        term_img = from_url(image_url)
-        term_img.draw()
+        # term-image warning must be filtered before the module loads
+        warnings.filterwarnings("ignore", category=UserWarning, message=".*not running within a terminal.*")
+        from term_image.image import AutoImage  # type: ignore
+
+        image = _take_prefetched(image_url)
+        if image is None:
+            image = _load_image(image_url)
+        AutoImage(image).draw()
     except Exception as exc:
         console.print(f"  [dim]Could not display cover art: {exc}[/dim]")
 
@@ -280,15 +1043,19 @@ def play_preview(url: str, duration_s: float = 30.0) -> None:
         return
 
     try:
-        response = requests.get(url, timeout=10)
-        response.raise_for_status()
+        import pygame
 
-        with tempfile.NamedTemporaryFile(suffix=".mp3", delete=False) as tmp:
-            tmp.write(response.content)
-            tmp_path = tmp.name
+        # Keep the clip in memory; pygame reads it straight from the buffer
+        data = _take_prefetched(url)
+        if data is not None:
+            buf = io.BytesIO(data)
+        else:
+            buf = io.BytesIO()
+            _download_to(url, buf)
+            buf.seek(0)
 
         pygame.mixer.init()
-        pygame.mixer.music.load(tmp_path)
+        pygame.mixer.music.load(buf, "mp3")
         pygame.mixer.music.play()
 
         console.print(f"  [green]▶  Playing preview… (press Enter to stop)[/green]")
@@ -299,7 +1066,6 @@ def play_preview(url: str, duration_s: float = 30.0) -> None:
         finally:
             pygame.mixer.music.stop()
             pygame.mixer.quit()
-            os.unlink(tmp_path)
 
     except Exception as exc:
         console.print(f"  [yellow]Could not play preview: {exc}[/yellow]")
@@ -308,9 +1074,27 @@ def play_preview(url: str, duration_s: float = 30.0) -> None:
 # ─────────────────────────────────────────────────────────────────
 # Display helpers
 # ─────────────────────────────────────────────────────────────────
-def print_track_list(tracks: list[SpotifyTrack]) -> None:
-    """Print a summary table of all tracks in the CSV."""
+# Long track lists only show this many rows from each end (see --list-all)
+TRACK_LIST_EDGE = 25
+
+
+def print_track_list(tracks: list[SpotifyTrack], list_all: bool = False) -> None:
+    """Print a summary table of the tracks in the CSV.
+
+    Lists longer than twice TRACK_LIST_EDGE show only their first and last
+    rows unless *list_all* is set; the whole table is written in one go.
+    """
+    numbered = list(enumerate(tracks, 1))
+    hidden = 0
+    if not list_all and len(tracks) > 2 * TRACK_LIST_EDGE:
+        hidden = len(tracks) - 2 * TRACK_LIST_EDGE
+        head, tail = numbered[:TRACK_LIST_EDGE], numbered[-TRACK_LIST_EDGE:]
+    else:
+        head, tail = numbered, []
+
     if _RICH_AVAILABLE:
+        from rich.table import Table
+
         table = Table(
             title=f"📋  Playlist – {len(tracks)} tracks",
             show_lines=False,
@@ -323,33 +1107,48 @@ def print_track_list(tracks: list[SpotifyTrack]) -> None:
         table.add_column("ISRC", style="dim", width=14)
         table.add_column("E", justify="center", width=3)
 
-        for i, t in enumerate(tracks, 1):
-            table.add_row(
-                str(i),
-                t.name,
-                t.artists,
-                t.album,
-                t.isrc or "—",
-                "🔞" if t.explicit else "",
-            )
+        def add_rows(rows: list[tuple[int, SpotifyTrack]]) -> None:
+            for i, t in rows:
+                table.add_row(
+                    str(i),
+                    t.name,
+                    t.artists,
+                    t.album,
+                    t.isrc or "—",
+                    "🔞" if t.explicit else "",
+                )
+
+        add_rows(head)
+        if hidden:
+            table.add_row("⋮", f"[dim]… {hidden} more tracks (use --list-all to show them)[/dim]", "", "", "", "")
+        add_rows(tail)
         console.print(table)
     else:
-        print(f"\n{'#':>4}  {'Track':<40} {'Artist':<30} ISRC")
-        print("─" * 100)
-        for i, t in enumerate(tracks, 1):
-            print(f"{i:>4}  {t.name[:39]:<40} {t.artists[:29]:<30} {t.isrc}")
+        lines = [f"\n{'#':>4}  {'Track':<40} {'Artist':<30} ISRC", "─" * 100]
+        lines += [f"{i:>4}  {t.name[:39]:<40} {t.artists[:29]:<30} {t.isrc}" for i, t in head]
+        if hidden:
+            lines.append(f"{'…':>4}  … {hidden} more tracks (use --list-all to show them)")
+        lines += [f"{i:>4}  {t.name[:39]:<40} {t.artists[:29]:<30} {t.isrc}" for i, t in tail]
+        print("\n".join(lines))
 
 
 def print_results_summary(results: list[ImportResult]) -> None:
     """Print the final import summary."""
-    added = [r for r in results if r.status == "added"]
-    skipped = [r for r in results if r.status == "skipped"]
-    not_found = [r for r in results if r.status == "not_found"]
+    added: list[ImportResult] = []
+    skipped: list[ImportResult] = []
+    not_found: list[ImportResult] = []
+    buckets = {_ADDED: added, _SKIPPED: skipped, _NOT_FOUND: not_found}
+    for r in results:
+        bucket = buckets.get(r.status)
+        if bucket is not None:
+            bucket.append(r)
 
     console.print("\n")
-    console.rule("[bold cyan]Import Summary[/bold cyan]" if _RICH_AVAILABLE else "Import Summary")
+    console.rule("[bold cyan]Import Summary[/bold cyan]")
 
     if _RICH_AVAILABLE:
+        from rich.table import Table
+
         summary = Table(show_header=False, box=None, padding=(0, 2))
         summary.add_column(style="bold")
         summary.add_column()
@@ -363,16 +1162,16 @@ def print_results_summary(results: list[ImportResult]) -> None:
         print(f"  Not found on TIDAL: {len(not_found)}")
 
     if added:
-        console.print("\n[bold green]🎶  Tracks added to playlist:[/bold green]" if _RICH_AVAILABLE else "\nTracks added:")
+        _say_bold_green("\n🎶  Tracks added to playlist:")
         for r in added:
             t = r.tidal_track
-            tidal_name = f"{t.name} — {t.artist.name}" if t and hasattr(t, "artist") else r.spotify_track.display_name()
-            console.print(f"  [green]✓[/green]  {tidal_name}" if _RICH_AVAILABLE else f"  ✓  {tidal_name}")
+            tidal_name = f"{t.name} — {t.artist.name}" if t and hasattr(t, "artist") else r.spotify_track.display
+            console.print(f"  [green]✓[/green]  {tidal_name}")
 
     if not_found:
-        console.print("\n[bold red]⚠️  Could not find on TIDAL:[/bold red]" if _RICH_AVAILABLE else "\nNot found on TIDAL:")
+        _say_bold_red("\n⚠️  Could not find on TIDAL:")
         for r in not_found:
-            console.print(f"  [red]✗[/red]  {r.spotify_track.display_name()}" if _RICH_AVAILABLE else f"  ✗  {r.spotify_track.display_name()}")
+            console.print(f"  [red]✗[/red]  {r.spotify_track.display}")
 
 
 def print_folder_summary(
@@ -383,9 +1182,11 @@ def print_folder_summary(
 ) -> None:
     """Print an overall summary after processing all CSVs in a folder."""
     console.print("\n")
-    console.rule("[bold cyan]Folder Import Summary[/bold cyan]" if _RICH_AVAILABLE else "Folder Import Summary")
+    console.rule("[bold cyan]Folder Import Summary[/bold cyan]")
 
     if _RICH_AVAILABLE:
+        from rich.table import Table
+
         summary = Table(show_header=False, box=None, padding=(0, 2))
         summary.add_column(style="bold")
         summary.add_column()
@@ -401,65 +1202,173 @@ def print_folder_summary(
         print(f"  Failed:           {len(failed)}")
 
     if imported:
-        console.print("\n[bold green]Imported playlists:[/bold green]" if _RICH_AVAILABLE else "\nImported playlists:")
+        _say_bold_green("\nImported playlists:")
         for name in imported:
-            console.print(f"  [green]✓[/green]  {name}" if _RICH_AVAILABLE else f"  ✓  {name}")
+            console.print(f"  [green]✓[/green]  {name}")
 
     if skipped:
-        console.print("\n[bold yellow]Skipped playlists:[/bold yellow]" if _RICH_AVAILABLE else "\nSkipped playlists:")
+        _say_bold_yellow("\nSkipped playlists:")
         for name in skipped:
-            console.print(f"  [yellow]–[/yellow]  {name}" if _RICH_AVAILABLE else f"  -  {name}")
+            console.print(f"  [yellow]–[/yellow]  {name}")
 
     if failed:
-        console.print("\n[bold red]Failed playlists:[/bold red]" if _RICH_AVAILABLE else "\nFailed playlists:")
+        _say_bold_red("\nFailed playlists:")
         for name, reason in failed:
-            console.print(f"  [red]✗[/red]  {name}: {reason}" if _RICH_AVAILABLE else f"  ✗  {name}: {reason}")
+            console.print(f"  [red]✗[/red]  {name}: {reason}")
 
 
 # ─────────────────────────────────────────────────────────────────
 # Core import logic
 # ─────────────────────────────────────────────────────────────────
+# Minimum seconds between progress description refreshes in import_all
+PROGRESS_UPDATE_INTERVAL = 0.1
+
+
 def import_all(
     session: tidalapi.Session,
     tracks: list[SpotifyTrack],
     playlist_name: str,
-) -> tuple[list[ImportResult], object]:
-    """Search for all tracks on TIDAL and add them to a new playlist at once."""
-    results: list[ImportResult] = []
+    concurrency: int = DEFAULT_CONCURRENCY,
+    quiet: bool = False,
+) -> tuple[list[ImportResult], Optional[object]]:
+    """Search for all tracks on TIDAL concurrently, adding matches to a new playlist as they arrive.
+
+    tidalapi is a blocking client, so lookups fan out over a small thread pool;
+    the worker threads spend nearly all of their time waiting on the network.
+    The playlist is filled from a background thread while the search is still
+    running, so the add requests overlap with the lookups instead of following
+    them. The playlist is created with the first match; None is returned in
+    its place when nothing matched. On Ctrl+C the matches found so far are
+    still added, and ImportInterrupted carries the playlist.
+
+    With ``quiet=True`` only warnings are printed, for imports running in the
+    background while folder mode prompts for the next playlist.
+    """
+    workers = max(1, min(concurrency, MAX_CONCURRENCY))
+    tidal_tracks: list[Optional[object]] = [None] * len(tracks)
+    resolved = [False] * len(tracks)
+    cache = _get_isrc_cache()
+
+    # Repeated tracks (common in merged and compilation playlists) are looked
+    # up once; first_by_key points each lookup key at the row that carries it.
+    first_by_key: dict[object, int] = {}
+    sources: list[int] = []
+    lookups: list[int] = []
+    for idx, track in enumerate(tracks):
+        source = first_by_key.setdefault(_lookup_key(track), idx)
+        sources.append(source)
+        if source == idx:
+            lookups.append(idx)
+    total = len(lookups)
+
+    adder = _PlaylistAdder(
+        functools.partial(_create_playlist, session, playlist_name, "Imported from Spotify", quiet=quiet)
+    )
+    next_row = 0
+
+    def _collect(future) -> int:
+        """Store a finished lookup and pass newly ready rows to the adder."""
+        nonlocal next_row
+        idx = futures[future]
+        tidal_tracks[idx] = future.result()
+        resolved[idx] = True
+
+        # Lookups finish out of order; release rows strictly in CSV order so
+        # the playlist order matches the export. Duplicates reuse the match
+        # of the earlier row that carried their lookup.
+        while next_row < len(tracks):
+            source = sources[next_row]
+            if not resolved[source]:
+                break
+            tidal_tracks[next_row] = tidal_tracks[source]
+            if tidal_tracks[next_row] is not None:
+                adder.put(tidal_tracks[next_row].id)
+            next_row += 1
+        return idx
+
+    if not quiet:
+        _say_cyan("\n🔍  Searching TIDAL for all tracks…")
+
+    interrupted = False
+    pool = ThreadPoolExecutor(max_workers=workers)
+    try:
+        # Resolve uncached ISRCs in bulk; only the misses need a per-track search
+        isrc_ids = resolve_isrcs(session, tracks, cache)
+
+        futures = {
+            # Only ids are needed to fill the playlist, so known ids skip hydration
+            pool.submit(
+                find_tidal_track, session, tracks[idx],
+                cache=cache, isrc_ids=isrc_ids, hydrate=False,
+            ): idx
+            for idx in lookups
+        }
+
+        if quiet:
+            for future in as_completed(futures):
+                _collect(future)
+        elif _RICH_AVAILABLE:
+            from rich.progress import Progress, SpinnerColumn, TextColumn
+
+            progress_ctx = Progress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                transient=True,
+            )
+            with progress_ctx as progress:
+                task = progress.add_task("Searching…", total=total)
+                last_update = 0.0
+                for future in as_completed(futures):
+                    idx = _collect(future)
+                    # The track name is cosmetic; refresh it at most ~10 times a second
+                    now = time.monotonic()
+                    if now - last_update >= PROGRESS_UPDATE_INTERVAL:
+                        progress.update(task, description=f"[cyan]{tracks[idx].name[:50]}[/cyan]")
+                        last_update = now
+                    progress.advance(task)
+        else:
+            for done, future in enumerate(as_completed(futures), 1):
+                idx = _collect(future)
+                print(f"  [{done}/{total}] {tracks[idx].name}…")
+    except KeyboardInterrupt:
+        interrupted = True
+    finally:
+        # On an interrupt, queued lookups are cancelled instead of waited for;
+        # their results would be thrown away anyway
+        pool.shutdown(wait=False, cancel_futures=True)
+        # The cache goes first: close() re-raises a failure to create the
+        # playlist, and the lookups are worth keeping either way
+        if cache is not None:
+            cache.flush()
+        # Flush whatever was matched, even if the search was interrupted
+        adder.close()
+
+    if interrupted:
+        raise ImportInterrupted(adder.playlist)
+
+    # Results are slotted back by index, so they keep the CSV order
+    results = [
+        ImportResult(
+            spotify_track=track,
+            tidal_track=tidal_track,
+            status=_ADDED if tidal_track else _NOT_FOUND,
+        )
+        for track, tidal_track in zip(tracks, tidal_tracks)
+    ]
 
-    console.print("\n[cyan]🔍  Searching TIDAL for all tracks…[/cyan]" if _RICH_AVAILABLE else "\nSearching TIDAL…")
+    playlist = adder.playlist
+    if playlist is None:
+        _say_yellow("⚠️  No tracks matched — no playlist was created.")
+        return results, None
 
-    if _RICH_AVAILABLE:
-        progress_ctx = Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            transient=True,
-        )
-        with progress_ctx as progress:
-            task = progress.add_task("Searching…", total=len(tracks))
-            for track in tracks:
-                progress.update(task, description=f"[cyan]{track.name[:50]}[/cyan]")
-                tidal_track = find_tidal_track(session, track)
-                results.append(ImportResult(
-                    spotify_track=track,
-                    tidal_track=tidal_track,
-                    status="added" if tidal_track else "not_found",
-                ))
-                progress.advance(task)
-    else:
-        for i, track in enumerate(tracks, 1):
-            print(f"  [{i}/{len(tracks)}] {track.name}…")
-            tidal_track = find_tidal_track(session, track)
-            results.append(ImportResult(
-                spotify_track=track,
-                tidal_track=tidal_track,
-                status="added" if tidal_track else "not_found",
-            ))
-
-    # Create the playlist and add found tracks
-    track_ids = [r.tidal_track.id for r in results if r.tidal_track]
-    playlist = _create_and_populate_playlist(session, playlist_name, track_ids)
+    # The final count is only known now; the description is cosmetic
+    try:
+        playlist.edit(description=f"Imported from Spotify — {adder.added} tracks")
+    except Exception:
+        pass
 
+    if not quiet:
+        _say_green(f"✅  Playlist created with {adder.added} tracks!")
     return results, playlist
 
 
@@ -467,102 +1376,230 @@ def import_individually(
     session: tidalapi.Session,
     tracks: list[SpotifyTrack],
     playlist_name: str,
-) -> tuple[list[ImportResult], object]:
-    """Let the user review each track before adding it."""
+    concurrency: int = DEFAULT_CONCURRENCY,
+) -> tuple[list[ImportResult], Optional[object]]:
+    """Let the user review each track before adding it.
+
+    Every track is looked up before its add prompt, so all lookups are
+    queued on a small thread pool up front; it works through them in order
+    while the user reviews, and most answers are ready when needed.
+    On Ctrl+C the tracks approved so far are saved, and ImportInterrupted
+    carries the playlist.
+    """
     results: list[ImportResult] = []
     total = len(tracks)
+    workers = max(1, min(concurrency, MAX_CONCURRENCY))
+    cache = _get_isrc_cache()
+    isrc_ids = resolve_isrcs(session, tracks, cache)
 
-    console.print()
-    for idx, track in enumerate(tracks, 1):
-        console.rule(
-            f"[bold cyan]Track {idx}/{total}[/bold cyan]"
-            if _RICH_AVAILABLE else f"Track {idx}/{total}"
-        )
+    pool = ThreadPoolExecutor(max_workers=workers)
+    lookups = [
+        pool.submit(find_tidal_track, session, track, cache=cache, isrc_ids=isrc_ids)
+        for track in tracks
+    ]
 
-        # Show track info
-        if _RICH_AVAILABLE:
-            console.print(Panel(
-                f"[bold white]{track.name}[/bold white]\n"
-                f"[cyan]Artist:[/cyan]  {track.artists}\n"
-                f"[cyan]Album:[/cyan]   {track.album}\n"
-                f"[cyan]ISRC:[/cyan]    {track.isrc or '—'}\n"
-                f"[cyan]Duration:[/cyan] {track.duration_ms // 60000}:{(track.duration_ms % 60000) // 1000:02d}"
-                + (" [red]🔞 Explicit[/red]" if track.explicit else ""),
-                title=f"[bold]{idx}/{total}[/bold]",
-                border_style="cyan",
-            ))
-        else:
-            print(f"\n  {track.name}")
-            print(f"  Artist:   {track.artists}")
-            print(f"  Album:    {track.album}")
-            print(f"  ISRC:     {track.isrc}")
-
-        # Cover art
-        if track.image_url:
-            show_cover = _ask_yes_no("  Show cover art?", default=False)
-            if show_cover:
-                display_cover_art(track.image_url)
-
-        # Preview snippet
-        if track.preview_url:
-            play = _ask_yes_no("  Play preview?", default=False)
-            if play:
-                play_preview(track.preview_url)
-
-        # Search TIDAL
-        console.print("  [cyan]Searching TIDAL…[/cyan]" if _RICH_AVAILABLE else "  Searching TIDAL…")
-        tidal_track = find_tidal_track(session, track)
-
-        if tidal_track:
-            tidal_info = f"[green]Found:[/green] {tidal_track.name} — {tidal_track.artist.name}" if _RICH_AVAILABLE else f"Found: {tidal_track.name} — {tidal_track.artist.name}"
-            console.print(f"  {tidal_info}")
-            add = _ask_yes_no("  Add to playlist?", default=True)
-            if add:
-                results.append(ImportResult(track, tidal_track, "added"))
+    try:
+        console.print()
+        for idx, track in enumerate(tracks, 1):
+            # Download media for this and the next track while the user reads
+            # (cover art is decoded off-thread too, so drawing it is instant)
+            for upcoming in tracks[idx - 1:idx + 1]:
+                if _TERM_IMAGE_AVAILABLE:
+                    _prefetch(upcoming.image_url, _load_image)
+                _prefetch(upcoming.preview_url)
+
+            console.rule(f"[bold cyan]Track {idx}/{total}[/bold cyan]")
+
+            # Show track info
+            if _RICH_AVAILABLE:
+                from rich.panel import Panel
+
+                console.print(Panel(
+                    f"[bold white]{track.name}[/bold white]\n"
+                    f"[cyan]Artist:[/cyan]  {track.artists}\n"
+                    f"[cyan]Album:[/cyan]   {track.album}\n"
+                    f"[cyan]ISRC:[/cyan]    {track.isrc or '—'}\n"
+                    f"[cyan]Duration:[/cyan] {track.duration_ms // 60000}:{(track.duration_ms % 60000) // 1000:02d}"
+                    + (" [red]🔞 Explicit[/red]" if track.explicit else ""),
+                    title=f"[bold]{idx}/{total}[/bold]",
+                    border_style="cyan",
+                ))
             else:
-                results.append(ImportResult(track, tidal_track, "skipped"))
-        else:
-            console.print("  [red]❌  Not found on TIDAL.[/red]" if _RICH_AVAILABLE else "  Not found on TIDAL.")
-            results.append(ImportResult(track, None, "not_found"))
+                print(f"\n  {track.name}")
+                print(f"  Artist:   {track.artists}")
+                print(f"  Album:    {track.album}")
+                print(f"  ISRC:     {track.isrc}")
+
+            # Cover art
+            if track.image_url:
+                show_cover = _ask_yes_no("  Show cover art?", default=False)
+                if show_cover:
+                    display_cover_art(track.image_url)
+
+            # Preview snippet
+            if track.preview_url:
+                play = _ask_yes_no("  Play preview?", default=False)
+                if play:
+                    play_preview(track.preview_url)
+
+            # Search TIDAL
+            _say_cyan("  Searching TIDAL…")
+            tidal_track = lookups[idx - 1].result()
+
+            if tidal_track:
+                console.print(f"  [green]Found:[/green] {tidal_track.name} — {tidal_track.artist.name}")
+                add = _ask_yes_no("  Add to playlist?", default=True)
+                if add:
+                    results.append(ImportResult(track, tidal_track, _ADDED))
+                else:
+                    results.append(ImportResult(track, tidal_track, _SKIPPED))
+            else:
+                _say_red("  ❌  Not found on TIDAL.")
+                results.append(ImportResult(track, None, _NOT_FOUND))
 
-        console.print()
+            console.print()
+    except KeyboardInterrupt:
+        # Keep the tracks approved so far instead of discarding the review
+        track_ids = [r.tidal_track.id for r in results if r.status == _ADDED and r.tidal_track]
+        playlist = None
+        if track_ids:
+            _say_yellow(f"\n⛔  Review interrupted — saving {len(track_ids)} approved track(s).")
+            playlist = _create_and_populate_playlist(session, playlist_name, track_ids)
+        raise ImportInterrupted(playlist) from None
+    finally:
+        # Drop lookups for tracks never reached (e.g. after Ctrl+C)
+        pool.shutdown(cancel_futures=True)
+        if cache is not None:
+            cache.flush()
 
     # Create playlist and add tracks
-    track_ids = [r.tidal_track.id for r in results if r.status == "added" and r.tidal_track]
+    track_ids = [r.tidal_track.id for r in results if r.status == _ADDED and r.tidal_track]
     playlist = _create_and_populate_playlist(session, playlist_name, track_ids)
 
     return results, playlist
 
 
+# Track ids sent per playlist.add() request
+PLAYLIST_ADD_CHUNK = 50
+
+
+def _chunks(items: list, size: int):
+    """Yield successive *size*-long slices of *items*."""
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def _add_chunk(playlist: object, chunk: list[int]) -> int:
+    """Add one chunk of track ids, backing off on 429s.
+
+    Returns how many tracks TIDAL reports as added. It skips duplicates and
+    ids that no longer exist, so this can be fewer than were sent.
+    """
+    try:
+        return _added_count(_retry_with_backoff(lambda: playlist.add(chunk)), chunk)
+    except Exception as exc:
+        # Usually a single bad id; add this chunk's tracks one by one
+        # so only the offending track is lost.
+        _say_yellow(f"Batch add failed ({exc}), trying {len(chunk)} tracks one-by-one…")
+        added = 0
+        for tid in chunk:
+            try:
+                added += _added_count(_retry_with_backoff(lambda: playlist.add([tid])), [tid])
+            except Exception as inner:
+                _say_red(f"  Could not add track {tid}: {inner}")
+        return added
+
+
+def _added_count(response: object, sent: list[int]) -> int:
+    """Number of tracks an add() call reports added.
+
+    tidalapi 0.8 returns the added item ids; older releases return nothing
+    useful, in which case every id sent is assumed to have been added.
+    """
+    return len(response) if isinstance(response, list) else len(sent)
+
+
+class _PlaylistAdder:
+    """Adds track ids to a playlist from a background thread as they arrive.
+
+    The playlist is only created, by calling *create*, once the first ids
+    are ready to send, so an import without a single match leaves nothing
+    behind on TIDAL. Ids are sent in PLAYLIST_ADD_CHUNK-sized requests, in
+    the order they were put(); close() flushes the remainder, waits for the
+    thread to finish and re-raises a failure to create the playlist.
+    """
+
+    def __init__(self, create, chunk_size: int = PLAYLIST_ADD_CHUNK):
+        self.playlist: Optional[object] = None
+        self.added = 0
+        self._create = create
+        self._error: Optional[Exception] = None
+        self._chunk_size = chunk_size
+        self._queue: queue.Queue[Optional[int]] = queue.Queue()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def put(self, track_id: int) -> None:
+        self._queue.put(track_id)
+
+    def close(self) -> None:
+        self._queue.put(None)
+        self._thread.join()
+        if self._error is not None:
+            raise self._error
+
+    def _run(self) -> None:
+        chunk: list[int] = []
+        try:
+            while (track_id := self._queue.get()) is not None:
+                chunk.append(track_id)
+                if len(chunk) >= self._chunk_size:
+                    self._flush(chunk)
+                    chunk = []
+            if chunk:
+                self._flush(chunk)
+        except Exception as exc:
+            self._error = exc
+
+    def _flush(self, chunk: list[int]) -> None:
+        if self.playlist is None:
+            self.playlist = self._create()
+        self.added += _add_chunk(self.playlist, chunk)
+
+
+def _create_playlist(
+    session: tidalapi.Session,
+    name: str,
+    description: str,
+    quiet: bool = False,
+) -> object:
+    """Create a new, empty TIDAL user playlist."""
+    if not quiet:
+        console.print(f"\n[cyan]📋  Creating playlist '[bold]{name}[/bold]'…[/cyan]")
+    return session.user.create_playlist(name, description)
+
+
 def _create_and_populate_playlist(
     session: tidalapi.Session,
     name: str,
     track_ids: list[int],
-) -> object:
-    """Create a new TIDAL user playlist and add track IDs to it."""
-    console.print(f"\n[cyan]📋  Creating playlist '[bold]{name}[/bold]'…[/cyan]" if _RICH_AVAILABLE else f"\nCreating playlist '{name}'…")
+) -> Optional[object]:
+    """Create a new TIDAL user playlist and add track IDs to it.
 
-    playlist = session.user.create_playlist(
-        name,
-        f"Imported from Spotify — {len(track_ids)} tracks",
-    )
+    Without any ids no playlist is created and None is returned.
+    """
+    if not track_ids:
+        _say_yellow("⚠️  No tracks to add — no playlist was created.")
+        return None
 
-    if track_ids:
-        console.print(f"[cyan]➕  Adding {len(track_ids)} tracks…[/cyan]" if _RICH_AVAILABLE else f"Adding {len(track_ids)} tracks…")
-        # tidalapi supports adding a list of IDs in one call
-        try:
-            playlist.add(track_ids)
-        except Exception as exc:
-            # Fallback: add one at a time if batch fails
-            console.print(f"[yellow]Batch add failed ({exc}), trying one-by-one…[/yellow]" if _RICH_AVAILABLE else f"Batch add failed, trying one-by-one…")
-            for tid in track_ids:
-                try:
-                    playlist.add([tid])
-                    time.sleep(0.2)
-                except Exception as inner:
-                    console.print(f"[red]  Could not add track {tid}: {inner}[/red]" if _RICH_AVAILABLE else f"  Could not add track {tid}: {inner}")
-
-    console.print(f"[green]✅  Playlist created![/green]" if _RICH_AVAILABLE else "Playlist created!")
+    playlist = _create_playlist(session, name, f"Imported from Spotify — {len(track_ids)} tracks")
+
+    _say_cyan(f"➕  Adding {len(track_ids)} tracks…")
+    # One request per chunk keeps each call under TIDAL's per-request cap
+    for chunk in _chunks(track_ids, PLAYLIST_ADD_CHUNK):
+        _add_chunk(playlist, chunk)
+
+    _say_green("✅  Playlist created!")
     return playlist
 
 
@@ -576,139 +1613,215 @@ def _csv_to_default_name(path: Path) -> str:
 
 def _prompt_playlist_name(default_name: str) -> str:
     """Ask the user to confirm or change a playlist name."""
+    if not _INTERACTIVE:
+        return default_name
     if _RICH_AVAILABLE:
+        from rich.prompt import Prompt
+
         return Prompt.ask(
             "[cyan]  Playlist name[/cyan]",
             default=default_name,
         )
-    raw = input(f"  Playlist name [{default_name}]: ").strip()
+    # If something has loaded readline, keep playlist names out of its history
+    readline = sys.modules.get("readline")
+    if readline is not None:
+        readline.set_auto_history(False)
+    try:
+        raw = input(f"  Playlist name [{default_name}]: ").strip()
+    finally:
+        if readline is not None:
+            readline.set_auto_history(True)
     return raw or default_name
 
 
 def _ask_import_mode() -> str:
     """Ask the user whether to import all tracks automatically or review each one."""
-    console.print(
-        "\n[bold]How would you like to import?[/bold]"
-        if _RICH_AVAILABLE else "\nHow would you like to import?"
-    )
-    console.print(
-        "  [cyan]all[/cyan]       – Add all tracks automatically"
-        if _RICH_AVAILABLE else "  all       - Add all tracks automatically"
-    )
-    console.print(
-        "  [cyan]review[/cyan]    – Review each track individually"
-        if _RICH_AVAILABLE else "  review    - Review each track individually"
-    )
+    if not _INTERACTIVE:
+        return "all"
+    _say_bold("\nHow would you like to import?")
+    console.print("  [cyan]all[/cyan]       – Add all tracks automatically")
+    console.print("  [cyan]review[/cyan]    – Review each track individually")
     return _ask_choice("\nChoose mode", ["all", "review"], default="all")
 
 
+def _file_size(path: Path) -> Optional[int]:
+    """Size of *path* in bytes, or None to leave the error to load_csv."""
+    try:
+        return path.stat().st_size
+    except OSError:
+        return None
+
+
+def _call_now(fn, *args) -> Future:
+    """Run *fn* in this thread and wrap its outcome in a finished Future."""
+    future: Future = Future()
+    try:
+        future.set_result(fn(*args))
+    except Exception as exc:
+        future.set_exception(exc)
+    return future
+
+
 def process_folder(
     folder: Path,
     session: tidalapi.Session,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    folder_concurrency: int = 1,
+    mode: Optional[str] = None,
+    list_all: bool = False,
 ) -> None:
     """
     Discover all CSV files in *folder*, present each one to the user
     for confirmation, allow renaming, then import or skip each one.
     For each playlist the user is asked whether to import all tracks
-    automatically or review them individually.
+    automatically or review them individually, unless *mode* fixes it.
+
+    With *folder_concurrency* above 1, up to that many automatic imports
+    run in the background while the user moves on to the next playlist;
+    their summaries are shown once the last playlist has been handled.
+    Reviews stay in the foreground since they need the terminal.
     """
     csv_files = discover_csv_files(folder)
 
     if not csv_files:
-        console.print(
-            f"[yellow]⚠️  No CSV files found in {folder}[/yellow]"
-            if _RICH_AVAILABLE else f"No CSV files found in {folder}"
-        )
+        _say_yellow(f"⚠️  No CSV files found in {folder}")
         return
 
-    console.print(
-        f"\n[bold cyan]📂  Found {len(csv_files)} CSV file(s) in {folder}[/bold cyan]"
-        if _RICH_AVAILABLE else f"\nFound {len(csv_files)} CSV file(s) in {folder}"
-    )
+    _say_bold_cyan(f"\n📂  Found {len(csv_files)} CSV file(s) in {folder}")
 
     # Tracking for final summary
     imported_names: list[str] = []
     skipped_names: list[str] = []
     failed_entries: list[tuple[str, str]] = []
 
-    for file_idx, csv_path in enumerate(csv_files, 1):
-        console.print("\n")
-        console.rule(
-            f"[bold cyan]Playlist {file_idx}/{len(csv_files)}: {csv_path.name}[/bold cyan]"
-            if _RICH_AVAILABLE else f"Playlist {file_idx}/{len(csv_files)}: {csv_path.name}"
-        )
+    # ── Load and validate every CSV up front ──────────────────────
+    # Broken and empty files are reported together instead of interrupting
+    # the prompts one by one. Parsing is CPU-bound and independent per file,
+    # but starting worker processes costs far more than parsing a few small
+    # exports, so the pool is only used when there is enough data to split.
+    sizes = {csv_path: _file_size(csv_path) for csv_path in csv_files}
+    workers = min(len(csv_files), os.cpu_count() or 1)
+    if workers > 1 and sum(size or 0 for size in sizes.values()) > MMAP_THRESHOLD * workers:
+        with ProcessPoolExecutor(max_workers=workers) as parse_pool:
+            parsed = {path: parse_pool.submit(load_csv, path, size) for path, size in sizes.items()}
+    else:
+        parsed = {path: _call_now(load_csv, path, size) for path, size in sizes.items()}
 
-        # ── Load and validate CSV ─────────────────────────────────
+    valid: dict[Path, list[SpotifyTrack]] = {}
+    for csv_path, future in parsed.items():
         try:
-            tracks = load_csv(csv_path)
+            tracks = future.result()
         except Exception as exc:
-            console.print(
-                f"[red]❌  Failed to read {csv_path.name}: {exc}[/red]"
-                if _RICH_AVAILABLE else f"Failed to read {csv_path.name}: {exc}"
-            )
+            _say_red(f"❌  Failed to read {csv_path.name}: {exc}")
             failed_entries.append((csv_path.name, str(exc)))
             continue
 
         if not tracks:
-            console.print(
-                f"[yellow]⚠️  {csv_path.name} contains no tracks — skipping.[/yellow]"
-                if _RICH_AVAILABLE else f"{csv_path.name} contains no tracks — skipping."
-            )
+            _say_yellow(f"⚠️  {csv_path.name} contains no tracks — skipping.")
             skipped_names.append(csv_path.name)
             continue
 
-        # ── Show track overview ───────────────────────────────────
-        print_track_list(tracks)
+        valid[csv_path] = tracks
 
-        # ── Ask: import or skip? ──────────────────────────────────
-        do_import = _ask_yes_no(
-            f"\n  Import this playlist ({len(tracks)} tracks)?",
-            default=True,
-        )
-        if not do_import:
-            console.print(
-                "[yellow]  ⏭️  Skipped.[/yellow]" if _RICH_AVAILABLE else "  Skipped."
-            )
-            skipped_names.append(csv_path.name)
-            continue
+    if len(valid) < len(csv_files):
+        _say_bold(f"\n  {len(valid)} valid, {len(csv_files) - len(valid)} unusable CSV file(s)")
 
-        # ── Allow renaming ────────────────────────────────────────
-        default_name = _csv_to_default_name(csv_path)
-        playlist_name = _prompt_playlist_name(default_name)
+    import_pool = ThreadPoolExecutor(max_workers=folder_concurrency) if folder_concurrency > 1 else None
+    background: list[tuple[str, Future]] = []
 
-        # ── Choose import mode for this playlist ──────────────────
-        mode = _ask_import_mode()
+    try:
+        for file_idx, (csv_path, tracks) in enumerate(valid.items(), 1):
+            console.print("\n")
+            console.rule(f"[bold cyan]Playlist {file_idx}/{len(valid)}: {csv_path.name}[/bold cyan]")
 
-        # ── Import ────────────────────────────────────────────────
-        try:
-            if mode == "review":
-                results, playlist = import_individually(session, tracks, playlist_name)
-            else:
-                results, playlist = import_all(session, tracks, playlist_name)
-        except KeyboardInterrupt:
-            console.print(
-                "\n[yellow]⛔  Import of current playlist interrupted.[/yellow]"
-                if _RICH_AVAILABLE else "\nImport of current playlist interrupted."
-            )
-            # Ask whether to continue with remaining files
-            if not _ask_yes_no("  Continue with remaining playlists?", default=True):
-                raise
-            skipped_names.append(playlist_name)
-            continue
-        except Exception as exc:
-            console.print(
-                f"[red]❌  Import failed for '{playlist_name}': {exc}[/red]"
-                if _RICH_AVAILABLE else f"Import failed for '{playlist_name}': {exc}"
+            # ── Show track overview ───────────────────────────────
+            print_track_list(tracks, list_all)
+
+            # ── Ask: import or skip? ──────────────────────────────
+            do_import = _ask_yes_no(
+                f"\n  Import this playlist ({len(tracks)} tracks)?",
+                default=True,
             )
-            failed_entries.append((playlist_name, str(exc)))
-            continue
+            if not do_import:
+                _say_yellow("  ⏭️  Skipped.")
+                skipped_names.append(csv_path.name)
+                continue
 
-        print_results_summary(results)
-        imported_names.append(playlist_name)
+            # ── Allow renaming ────────────────────────────────────
+            default_name = _csv_to_default_name(csv_path)
+            playlist_name = _prompt_playlist_name(default_name)
 
-        # ── Optionally open in browser ────────────────────────────
-        if _ask_yes_no("  Open this playlist in browser?", default=False):
-            open_playlist(playlist)
+            # ── Choose import mode for this playlist ──────────────
+            playlist_mode = mode or _ask_import_mode()
+
+            # ── Import ────────────────────────────────────────────
+            if playlist_mode == "all" and import_pool is not None:
+                future = import_pool.submit(import_all, session, tracks, playlist_name, concurrency, quiet=True)
+                background.append((playlist_name, future))
+                _say_cyan("  ⏳  Importing in the background…")
+                continue
+
+            try:
+                if playlist_mode == "review":
+                    results, playlist = import_individually(session, tracks, playlist_name, concurrency)
+                else:
+                    results, playlist = import_all(session, tracks, playlist_name, concurrency)
+            except KeyboardInterrupt as exc:
+                _say_yellow("\n⛔  Import of current playlist interrupted.")
+                if isinstance(exc, ImportInterrupted) and exc.playlist is not None:
+                    _say_yellow(f"  💾  Tracks found so far were saved to '{playlist_name}'.")
+                    imported_names.append(f"{playlist_name} (partial)")
+                else:
+                    skipped_names.append(playlist_name)
+                # Ask whether to continue with remaining files
+                if not _ask_yes_no("  Continue with remaining playlists?", default=True):
+                    raise
+                continue
+            except Exception as exc:
+                _say_red(f"❌  Import failed for '{playlist_name}': {exc}")
+                failed_entries.append((playlist_name, str(exc)))
+                continue
+
+            print_results_summary(results)
+            sys.stdout.flush()
+            if playlist is None:
+                failed_entries.append((playlist_name, "no tracks to add, playlist not created"))
+                continue
+            imported_names.append(playlist_name)
+
+            # ── Optionally open in browser ────────────────────────
+            if _ask_yes_no("  Open this playlist in browser?", default=False):
+                open_playlist(playlist)
+
+        # ── Collect background imports ────────────────────────────
+        if background:
+            _say_cyan(f"\n⏳  Waiting for {len(background)} background import(s)…")
+        for playlist_name, future in background:
+            console.print("\n")
+            console.rule(f"[bold cyan]{playlist_name}[/bold cyan]")
+            try:
+                results, playlist = future.result()
+            except Exception as exc:
+                _say_red(f"❌  Import failed for '{playlist_name}': {exc}")
+                failed_entries.append((playlist_name, str(exc)))
+                continue
+
+            print_results_summary(results)
+            sys.stdout.flush()
+            if playlist is None:
+                failed_entries.append((playlist_name, "no tracks to add, playlist not created"))
+                continue
+            imported_names.append(playlist_name)
+            if _ask_yes_no("  Open this playlist in browser?", default=False):
+                open_playlist(playlist)
+    finally:
+        if import_pool is not None:
+            # Imports still queued (e.g. after Ctrl+C) must not go on to create
+            # playlists; ones already running can't be stopped, only reported
+            import_pool.shutdown(wait=False, cancel_futures=True)
+            unfinished = [name for name, future in background if not future.done()]
+            if unfinished:
+                _say_yellow(f"\n⚠️  Still finishing in the background: {', '.join(unfinished)}")
 
     # ── Overall folder summary ────────────────────────────────────
     print_folder_summary(csv_files, imported_names, skipped_names, failed_entries)
@@ -717,15 +1830,28 @@ def process_folder(
 # ─────────────────────────────────────────────────────────────────
 # Input helpers
 # ─────────────────────────────────────────────────────────────────
+# Prompts are only shown on a real terminal; piped/CI runs (and --assume-yes)
+# take each prompt's default answer without touching the terminal.
+_INTERACTIVE = sys.stdin is not None and sys.stdin.isatty()
+
+
 def _ask_yes_no(prompt: str, default: bool = True) -> bool:
     """Prompt the user for a yes/no answer, returning a bool."""
+    if not _INTERACTIVE:
+        return default
+
     suffix = " [Y/n]" if default else " [y/N]"
     while True:
         try:
             if _RICH_AVAILABLE:
+                from rich.prompt import Prompt
+
                 raw = Prompt.ask(prompt + suffix, default="y" if default else "n")
             else:
-                raw = input(prompt + suffix + " ").strip()
+                sys.stdout.write(prompt + suffix + " ")
+                sys.stdout.flush()
+                # readline() gives "" at EOF, which takes the default like an empty answer
+                raw = sys.stdin.readline().strip()
             if not raw:
                 return default
             return raw.lower() in ("y", "yes")
@@ -735,6 +1861,9 @@ def _ask_yes_no(prompt: str, default: bool = True) -> bool:
 
 def _ask_choice(prompt: str, choices: list[str], default: str) -> str:
     """Prompt the user to pick from a list of options."""
+    if not _INTERACTIVE:
+        return default.lower()
+
     options = "/".join(
         f"[bold]{c}[/bold]" if c == default else c
         for c in choices
@@ -743,13 +1872,15 @@ def _ask_choice(prompt: str, choices: list[str], default: str) -> str:
     while True:
         try:
             if _RICH_AVAILABLE:
+                from rich.prompt import Prompt
+
                 raw = Prompt.ask(f"{prompt} [{options}]", default=default)
             else:
                 raw = input(f"{prompt} ({'/'.join(choices)}) [{default}]: ").strip()
             raw = raw.lower() if raw else default.lower()
             if raw in [c.lower() for c in choices]:
                 return raw
-            console.print(f"[red]Please choose one of: {', '.join(choices)}[/red]" if _RICH_AVAILABLE else f"Please choose one of: {', '.join(choices)}")
+            _say_red(f"Please choose one of: {', '.join(choices)}")
         except (EOFError, KeyboardInterrupt):
             return default.lower()
 
@@ -759,32 +1890,62 @@ def _ask_choice(prompt: str, choices: list[str], default: str) -> str:
 # ─────────────────────────────────────────────────────────────────
 def open_playlist(playlist: object) -> None:
     """Open the newly created TIDAL playlist in the browser or app."""
-    # tidalapi provides listen_url and share_url on playlists
-    url: Optional[str] = None
-
-    for attr in ("listen_url", "share_url"):
-        candidate = getattr(playlist, attr, None)
-        if candidate:
-            url = candidate
-            break
-
-    # Construct URL from UUID as last resort
-    if not url:
-        uuid = getattr(playlist, "id", None) or getattr(playlist, "uuid", None)
-        if uuid:
-            url = f"https://tidal.com/browse/playlist/{uuid}"
+    # tidalapi provides listen_url and share_url on playlists; construct the
+    # URL from the UUID as a last resort
+    url: Optional[str] = (
+        getattr(playlist, "listen_url", None)
+        or getattr(playlist, "share_url", None)
+        or (
+            f"https://tidal.com/browse/playlist/{uuid}"
+            if (uuid := getattr(playlist, "id", None) or getattr(playlist, "uuid", None))
+            else None
+        )
+    )
 
     if url:
-        console.print(f"\n[bold cyan]🌐  Opening playlist:[/bold cyan] {url}" if _RICH_AVAILABLE else f"\nOpening: {url}")
-        webbrowser.open(url)
+        # A detached opener can fail without a trace (e.g. no display), so
+        # the link is always shown for opening by hand
+        console.print(f"\n[bold cyan]🌐  Opening playlist:[/bold cyan] {url}")
+        console.print("[dim]If no browser opens, copy the link above into one.[/dim]")
+        _open_url(url)
     else:
-        console.print("[yellow]Could not determine playlist URL.[/yellow]" if _RICH_AVAILABLE else "Could not determine playlist URL.")
+        _say_yellow("Could not determine playlist URL.")
+
+
+# Desktop helpers that open a URL in the default browser
+_URL_OPENERS = {"darwin": "open", "linux": "xdg-open"}
+
+
+def _open_url(url: str) -> None:
+    """Open *url* in the default browser without waiting for it to start.
+
+    On macOS and Linux the platform opener is launched as a detached process.
+    webbrowser takes over when $BROWSER names a browser (it honours that
+    variable, the openers don't), on other platforms, or if launching fails;
+    on Windows it already returns immediately.
+    """
+    opener = _URL_OPENERS.get(sys.platform)
+    if opener and not os.environ.get("BROWSER") and shutil.which(opener):
+        try:
+            subprocess.Popen(
+                [opener, url],
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                start_new_session=True,
+            )
+            return
+        except OSError:
+            pass
+    webbrowser.open(url)
 
 
 # ─────────────────────────────────────────────────────────────────
 # Main entry point
 # ─────────────────────────────────────────────────────────────────
-def main() -> None:
+@functools.cache
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command-line parser (once; later calls reuse it)."""
     parser = argparse.ArgumentParser(
         description="Import a Spotify playlist CSV into TIDAL.",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -808,6 +1969,18 @@ def main() -> None:
     )
 
     parser.add_argument("--name", "-n", default=None, help="Name for the new TIDAL playlist (single-file mode only)")
+    parser.add_argument(
+        "--mode",
+        "-m",
+        choices=["all", "review"],
+        default=None,
+        help="Import mode for every playlist instead of asking: add all matches, or review each track",
+    )
+    parser.add_argument(
+        "--list-all",
+        action="store_true",
+        help=f"Show every track before importing (default: first and last {TRACK_LIST_EDGE} of long lists)",
+    )
     parser.add_argument(
         "--session-file",
         "-s",
@@ -815,7 +1988,42 @@ def main() -> None:
         metavar="FILE",
         help="JSON file to persist/load TIDAL session (default: tidal_session.json)",
     )
-    args = parser.parse_args()
+    parser.add_argument(
+        "--concurrency",
+        "-c",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        metavar="N",
+        help=f"Number of parallel TIDAL lookups (default: {DEFAULT_CONCURRENCY}, max: {MAX_CONCURRENCY})",
+    )
+    parser.add_argument(
+        "--folder-concurrency",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Folder mode: run up to N automatic imports in the background while "
+        "you go through the remaining playlists (default: 1, one after another)",
+    )
+    parser.add_argument(
+        "--rate",
+        type=float,
+        default=DEFAULT_RATE,
+        metavar="REQ/S",
+        help=f"Maximum TIDAL API requests per second (default: {DEFAULT_RATE:g})",
+    )
+    parser.add_argument(
+        "--assume-yes",
+        "-y",
+        action="store_true",
+        help="Accept the default answer to every prompt (implied when stdin is not a terminal)",
+    )
+    return parser
+
+
+def main() -> None:
+    global _INTERACTIVE
+
+    args = _build_parser().parse_args()
 
     # ── Validate arguments ────────────────────────────────────────
     if not args.csv and not args.folder:
@@ -824,55 +2032,68 @@ def main() -> None:
             "You can export your playlists using Exportify: https://exportify.app/"
         )
 
+    if args.rate <= 0:
+        sys.exit("❌  --rate must be greater than 0.")
+    if args.folder_concurrency < 1:
+        sys.exit("❌  --folder-concurrency must be at least 1.")
+    _tidal_limiter.configure(args.rate)
+
+    if args.assume_yes:
+        _INTERACTIVE = False
+
     if args.folder and args.name:
-        console.print(
-            "[yellow]⚠️  --name is ignored in folder mode. You will be prompted to name each playlist.[/yellow]"
-            if _RICH_AVAILABLE else "Warning: --name is ignored in folder mode."
-        )
+        _say_yellow("⚠️  --name is ignored in folder mode. You will be prompted to name each playlist.")
 
-    # ── Banner ────────────────────────────────────────────────────
-    if _RICH_AVAILABLE:
-        console.print(Panel.fit(
-            "[bold cyan]🎵  Spotify → TIDAL Playlist Importer[/bold cyan]",
-            border_style="cyan",
-        ))
+    # Check the paths before logging in, so a typo doesn't cost an OAuth round-trip
+    if args.folder:
+        folder_path = Path(args.folder)
+        if not folder_path.is_dir():
+            sys.exit(f"❌  Not a directory: {folder_path}")
     else:
-        print("\n=== Spotify → TIDAL Playlist Importer ===\n")
+        csv_path = Path(args.csv)
+        try:
+            csv_stat = csv_path.stat()
+        except OSError:
+            sys.exit(f"❌  File not found: {csv_path}")
+        if not stat.S_ISREG(csv_stat.st_mode):
+            sys.exit(f"❌  Not a file: {csv_path}")
+
+    # ── Banner ────────────────────────────────────────────────────
+    console.print(_panel_class().fit(
+        "[bold cyan]🎵  Spotify → TIDAL Playlist Importer[/bold cyan]",
+        border_style="cyan",
+    ))
+    sys.stdout.flush()
 
     # ── Authenticate once for all imports ─────────────────────────
     session = get_tidal_session(args.session_file)
 
     # ── Folder mode ───────────────────────────────────────────────
     if args.folder:
-        folder_path = Path(args.folder)
-        if not folder_path.is_dir():
-            sys.exit(f"❌  Not a directory: {folder_path}")
-
         try:
-            process_folder(folder_path, session)
+            process_folder(
+                folder_path, session, args.concurrency, args.folder_concurrency, args.mode, args.list_all,
+            )
         except KeyboardInterrupt:
             sys.exit("\n\n⛔  Import cancelled by user.")
 
-        console.print("\n[bold green]🎉  Done![/bold green]\n" if _RICH_AVAILABLE else "\nDone!\n")
+        _say_bold_green("\n🎉  Done!\n")
         return
 
     # ── Single-file mode ──────────────────────────────────────────
-    csv_path = Path(args.csv)
-    if not csv_path.exists():
-        sys.exit(f"❌  File not found: {csv_path}")
-
-    console.print(f"\n[cyan]📂  Loading:[/cyan] {csv_path}" if _RICH_AVAILABLE else f"\nLoading: {csv_path}")
+    console.print(f"\n[cyan]📂  Loading:[/cyan] {csv_path}")
     try:
-        tracks = load_csv(csv_path)
+        tracks = load_csv(csv_path, csv_stat.st_size)
     except Exception as exc:
         sys.exit(f"❌  Failed to read CSV: {exc}")
 
     if not tracks:
         sys.exit("❌  No tracks found in CSV.")
 
-    console.print(f"[green]✅  Loaded {len(tracks)} tracks.[/green]" if _RICH_AVAILABLE else f"Loaded {len(tracks)} tracks.")
+    _say_green(f"✅  Loaded {len(tracks)} tracks.")
+    sys.stdout.flush()
 
-    print_track_list(tracks)
+    print_track_list(tracks, args.list_all)
 
     # Playlist name
     if args.name:
@@ -881,22 +2102,24 @@ def main() -> None:
         default_name = _csv_to_default_name(csv_path)
         playlist_name = _prompt_playlist_name(default_name)
 
-    mode = _ask_import_mode()
+    mode = args.mode or _ask_import_mode()
 
     try:
         if mode == "review":
-            results, playlist = import_individually(session, tracks, playlist_name)
+            results, playlist = import_individually(session, tracks, playlist_name, args.concurrency)
         else:
-            results, playlist = import_all(session, tracks, playlist_name)
-    except KeyboardInterrupt:
+            results, playlist = import_all(session, tracks, playlist_name, args.concurrency)
+    except KeyboardInterrupt as exc:
+        if isinstance(exc, ImportInterrupted) and exc.playlist is not None:
+            _say_yellow(f"\n💾  Tracks found so far were saved to playlist '{playlist_name}'.")
         sys.exit("\n\n⛔  Import cancelled by user.")
 
     print_results_summary(results)
 
-    if _ask_yes_no("\nOpen playlist in browser?", default=True):
+    if playlist is not None and _ask_yes_no("\nOpen playlist in browser?", default=True):
         open_playlist(playlist)
 
-    console.print("\n[bold green]🎉  Done![/bold green]\n" if _RICH_AVAILABLE else "\nDone!\n")
+    _say_bold_green("\n🎉  Done!\n")
 
 
 if __name__ == "__main__":